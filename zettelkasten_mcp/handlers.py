@@ -1,5 +1,8 @@
 """Tool handlers for Zettelkasten MCP server."""
 
+import os
+import shutil
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -7,6 +10,7 @@ from typing import Any
 from mcp.types import TextContent
 
 from .config import Config
+from .patches import append_text, apply_unified_diff, content_hash, replace_lines
 from .responses import *
 
 
@@ -170,7 +174,8 @@ def handle_apply_template(arguments: dict, config: Config) -> list[TextContent]:
             text=RESPONSE_CARD_SAVED.format(
                 filepath=filepath,
                 backup_msg=backup_msg,
-                file_size=len(formatted_card)
+                file_size=len(formatted_card),
+                content_hash=content_hash(formatted_card)
             )
         )]
 
@@ -181,6 +186,140 @@ def handle_apply_template(arguments: dict, config: Config) -> list[TextContent]:
         )]
 
 
+# ============================================================================
+# Card Editing Handlers
+# ============================================================================
+
+def _resolve_card_path(card: str, config: Config) -> Path | list[str] | None:
+    """Resolve a card identifier to a file in the output directory.
+
+    Accepts a filename (with or without .md) or a timestamp uid prefix.
+
+    Returns:
+        Path of the card, list of candidate filenames if the uid is ambiguous,
+        or None if nothing matches.
+    """
+    filename = card if card.endswith('.md') else f"{card}.md"
+    filepath = config.output_directory / filename
+    if filepath.is_file():
+        return filepath
+
+    matches = sorted(config.output_directory.glob(f"{card} - *.md"))
+    if len(matches) == 1:
+        return matches[0]
+    if matches:
+        return [match.name for match in matches]
+    return None
+
+
+def _write_atomic(filepath: Path, text: str) -> None:
+    """Write text to a temp file beside filepath, then rename it into place."""
+    fd, tmp_name = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+        shutil.copymode(filepath, tmp_name)
+        os.replace(tmp_name, filepath)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def handle_edit_card(arguments: dict, config: Config) -> list[TextContent]:
+    """Handle edit_card tool call - patches an existing card in place."""
+    from .server import validate_output_path
+
+    card = arguments["card"]
+    operation = arguments["operation"]
+    expected_hash = arguments.get("expected_hash")
+    expected_mtime = arguments.get("expected_mtime")
+
+    filepath = _resolve_card_path(card, config)
+    if filepath is None:
+        return [TextContent(
+            type="text",
+            text=ERROR_CARD_NOT_FOUND.format(card=card, output_directory=config.output_directory)
+        )]
+    if isinstance(filepath, list):
+        return [TextContent(
+            type="text",
+            text=ERROR_CARD_AMBIGUOUS.format(card=card, matches=", ".join(filepath))
+        )]
+    if not validate_output_path(filepath, config.output_directory):
+        return [TextContent(type="text", text=ERROR_PATH_TRAVERSAL)]
+
+    # Read current version and check the optimistic concurrency precondition
+    try:
+        stat = filepath.stat()
+        with open(filepath, 'r') as f:
+            current = f.read()
+    except Exception as e:
+        return [TextContent(
+            type="text",
+            text=ERROR_SAVE_FAILED.format(error=str(e))
+        )]
+
+    current_hash = content_hash(current)
+    if expected_hash is None and expected_mtime is None:
+        return [TextContent(
+            type="text",
+            text=ERROR_EDIT_PRECONDITION_REQUIRED.format(content_hash=current_hash, mtime=stat.st_mtime)
+        )]
+    if ((expected_hash is not None and expected_hash != current_hash)
+            or (expected_mtime is not None and float(expected_mtime) != stat.st_mtime)):
+        return [TextContent(
+            type="text",
+            text=ERROR_EDIT_CONFLICT.format(content_hash=current_hash, mtime=stat.st_mtime)
+        )]
+
+    # Apply patch
+    try:
+        if operation == "unified_diff":
+            updated = apply_unified_diff(current, arguments["diff"])
+        elif operation == "replace_lines":
+            updated = replace_lines(
+                current,
+                int(arguments["start_line"]),
+                int(arguments["end_line"]),
+                arguments.get("text", "")
+            )
+        elif operation == "append":
+            updated = append_text(current, arguments["text"])
+        else:
+            raise ValueError(f"Unknown operation '{operation}'")
+    except (KeyError, ValueError) as e:
+        return [TextContent(
+            type="text",
+            text=ERROR_PATCH_FAILED.format(error=str(e))
+        )]
+
+    # Write atomically, re-checking that nobody modified the card meanwhile
+    try:
+        if filepath.stat().st_mtime_ns != stat.st_mtime_ns:
+            latest = filepath.stat()
+            with open(filepath, 'r') as f:
+                latest_hash = content_hash(f.read())
+            return [TextContent(
+                type="text",
+                text=ERROR_EDIT_CONFLICT.format(content_hash=latest_hash, mtime=latest.st_mtime)
+            )]
+        _write_atomic(filepath, updated)
+        new_mtime = filepath.stat().st_mtime
+    except Exception as e:
+        return [TextContent(
+            type="text",
+            text=ERROR_SAVE_FAILED.format(error=str(e))
+        )]
+
+    return [TextContent(
+        type="text",
+        text=RESPONSE_CARD_EDITED.format(
+            filepath=filepath,
+            file_size=len(updated),
+            content_hash=content_hash(updated),
+            mtime=new_mtime
+        )
+    )]
 
 
 # ============================================================================
@@ -199,6 +338,9 @@ TOOL_HANDLERS = {
     "start_card_generation": handle_start_card_generation,
     "generate_heading": handle_generate_heading,
     "apply_template": handle_apply_template,
+
+    # Card Editing
+    "edit_card": handle_edit_card,
 }
 
 
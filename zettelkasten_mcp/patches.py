@@ -0,0 +1,151 @@
+"""Patch application for in-place card edits.
+
+All functions operate on card text and raise ValueError when a patch
+cannot be applied cleanly, so handlers can report the problem without
+touching the file.
+"""
+
+import hashlib
+import re
+
+
+HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+def content_hash(text: str) -> str:
+    """Return the SHA-256 hex digest used as the card version token."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _ensure_newline(line: str) -> str:
+    """Terminate a line with a newline if it lacks one."""
+    return line if line.endswith("\n") else line + "\n"
+
+
+def replace_lines(text: str, start_line: int, end_line: int, new_text: str) -> str:
+    """Replace lines start_line..end_line (1-based, inclusive) with new_text.
+
+    Passing end_line = start_line - 1 inserts new_text before start_line
+    without removing anything.
+
+    Args:
+        text: Current card content
+        start_line: First line to replace
+        end_line: Last line to replace
+        new_text: Replacement text (may be empty to delete the range)
+
+    Returns:
+        Updated card content
+    """
+    lines = text.splitlines(keepends=True)
+    if start_line < 1 or start_line > len(lines) + 1:
+        raise ValueError(f"start_line {start_line} is outside the card (1-{len(lines) + 1})")
+    if end_line < start_line - 1 or end_line > len(lines):
+        raise ValueError(f"end_line {end_line} is outside the card ({start_line - 1}-{len(lines)})")
+
+    replacement = new_text.splitlines(keepends=True)
+    # Keep the line after the replaced range on its own line
+    if replacement and end_line < len(lines):
+        replacement[-1] = _ensure_newline(replacement[-1])
+    # Keep the replaced range separated from the line before it
+    if start_line > 1 and start_line - 1 == len(lines):
+        lines[-1] = _ensure_newline(lines[-1])
+
+    lines[start_line - 1:end_line] = replacement
+    return "".join(lines)
+
+
+def append_text(text: str, new_text: str) -> str:
+    """Append new_text to the end of the card as a separate section.
+
+    Args:
+        text: Current card content
+        new_text: Text to append
+
+    Returns:
+        Updated card content
+    """
+    if not text:
+        return new_text
+    if text.endswith("\n\n"):
+        separator = ""
+    elif text.endswith("\n"):
+        separator = "\n"
+    else:
+        separator = "\n\n"
+    return text + separator + _ensure_newline(new_text)
+
+
+def apply_unified_diff(text: str, diff: str) -> str:
+    """Apply a unified diff to the card content.
+
+    Hunks must match the card exactly at the line numbers given in their
+    headers; fuzzy matching is deliberately not attempted so a stale diff
+    is rejected rather than applied in the wrong place.
+
+    Args:
+        text: Current card content
+        diff: Unified diff (file headers optional)
+
+    Returns:
+        Updated card content
+    """
+    lines = text.splitlines(keepends=True)
+    diff_lines = diff.splitlines(keepends=True)
+    while diff_lines and diff_lines[-1].strip("\r\n") == "":
+        diff_lines.pop()
+    result: list[str] = []
+    cursor = 0  # Index of next unconsumed line in `lines`
+    hunk_count = 0
+    i = 0
+
+    while i < len(diff_lines):
+        match = HUNK_HEADER.match(diff_lines[i])
+        if not match:
+            i += 1
+            continue
+
+        hunk_count += 1
+        old_start = int(match.group(1))
+        old_len = int(match.group(2)) if match.group(2) is not None else 1
+        # A zero-length old range points at the line *before* the insertion
+        hunk_start = old_start if old_len == 0 else old_start - 1
+        if hunk_start < cursor:
+            raise ValueError(f"Hunk {hunk_count} overlaps a previous hunk")
+        if hunk_start > len(lines):
+            raise ValueError(f"Hunk {hunk_count} starts beyond the end of the card")
+
+        result.extend(lines[cursor:hunk_start])
+        cursor = hunk_start
+        i += 1
+
+        while i < len(diff_lines) and not HUNK_HEADER.match(diff_lines[i]):
+            line = diff_lines[i]
+            if line.strip("\r\n") == "":
+                # Treat bare blank lines as empty context (trailing space stripped by client)
+                line = " " + line
+            tag, body = line[:1], line[1:]
+            if tag in (" ", "-"):
+                if cursor >= len(lines) or lines[cursor].rstrip("\r\n") != body.rstrip("\r\n"):
+                    raise ValueError(
+                        f"Hunk {hunk_count} does not match the card at line {cursor + 1}"
+                    )
+                if tag == " ":
+                    result.append(lines[cursor])
+                cursor += 1
+            elif tag == "+":
+                result.append(_ensure_newline(body))
+            elif tag == "\\":
+                # "\ No newline at end of file" applies to the preceding line
+                previous = diff_lines[i - 1][:1]
+                if previous in (" ", "+") and result:
+                    result[-1] = result[-1].rstrip("\r\n")
+            else:
+                raise ValueError(f"Unrecognized diff line in hunk {hunk_count}: {line.rstrip()}")
+            i += 1
+
+    if hunk_count == 0:
+        raise ValueError("Diff contains no hunks")
+
+    result.extend(lines[cursor:])
+    return "".join(result)
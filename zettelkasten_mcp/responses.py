@@ -117,7 +117,11 @@ Based on the card title and content summary, generate a detailed, descriptive he
 
 RESPONSE_CARD_SAVED = """Card saved: {filepath}{backup_msg}
 
-{file_size} characters written."""
+{file_size} characters written. Hash: {content_hash}"""
+
+RESPONSE_CARD_EDITED = """Card updated: {filepath}
+
+{file_size} characters. Hash: {content_hash} Mtime: {mtime}"""
 
 # Error Messages
 
@@ -131,4 +135,14 @@ ERROR_BACKUP_FAILED = "Error creating backup: {error}"
 
 ERROR_SAVE_FAILED = "Error saving card: {error}"
 
+ERROR_CARD_NOT_FOUND = "Error: No card matching '{card}' in {output_directory}"
+
+ERROR_CARD_AMBIGUOUS = "Error: '{card}' matches several cards: {matches}"
+
+ERROR_EDIT_PRECONDITION_REQUIRED = "Error: Provide expected_hash or expected_mtime. Current hash: {content_hash} Mtime: {mtime}"
+
+ERROR_EDIT_CONFLICT = "Error: Card changed since it was last read. Current hash: {content_hash} Mtime: {mtime}"
+
+ERROR_PATCH_FAILED = "Error applying patch: {error}"
+
 ERROR_UNKNOWN_TOOL = "Unknown tool: {tool_name}"
@@ -175,6 +175,50 @@ async def list_tools() -> list[Tool]:
                 "required": ["formatted_card", "filename"]
             }
         ),
+        # Card Editing
+        Tool(
+            name="edit_card",
+            description="Edit an existing card in place with a small patch instead of regenerating it. Fails if the card changed since the given hash or mtime.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "card": {
+                        "type": "string",
+                        "description": "Card filename, or its timestamp uid (YYYYMMDDHHMMSS)"
+                    },
+                    "operation": {
+                        "type": "string",
+                        "enum": ["unified_diff", "replace_lines", "append"],
+                        "description": "Patch type to apply"
+                    },
+                    "diff": {
+                        "type": "string",
+                        "description": "Unified diff against the current card (unified_diff)"
+                    },
+                    "start_line": {
+                        "type": "integer",
+                        "description": "First line to replace, 1-based (replace_lines)"
+                    },
+                    "end_line": {
+                        "type": "integer",
+                        "description": "Last line to replace, inclusive; start_line - 1 inserts without removing (replace_lines)"
+                    },
+                    "text": {
+                        "type": "string",
+                        "description": "Replacement text (replace_lines) or section to append (append)"
+                    },
+                    "expected_hash": {
+                        "type": "string",
+                        "description": "SHA-256 hash of the card as last seen"
+                    },
+                    "expected_mtime": {
+                        "type": "number",
+                        "description": "Modification time of the card as last seen"
+                    }
+                },
+                "required": ["card", "operation"]
+            }
+        ),
     ]
 
 